@@ -2,7 +2,8 @@
 
 from .agent import RESTAPIAgent
 from .memory import ConversationMemory
+from .observations import ObservationFormatter
 from .tools import create_api_tools
 
-__all__ = ["RESTAPIAgent", "ConversationMemory", "create_api_tools"]
+__all__ = ["RESTAPIAgent", "ConversationMemory", "ObservationFormatter", "create_api_tools"]
 
@@ -7,6 +7,7 @@ from langchain_core.messages import HumanMessage, AIMessage
 
 from .tools import create_api_tools
 from .memory import ConversationMemory
+from .observations import ObservationFormatter
 from .callbacks import ConsoleCallbackHandler
 
 
@@ -20,14 +21,16 @@ class RESTAPIAgent:
         api_base_url: str = "http://localhost:8000",
         api_key: Optional[str] = None,
         model_name: str = "gpt-4o-mini",
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        observation_formatter: Optional[ObservationFormatter] = None
     ):
         self.api_base_url = api_base_url
         self.api_key = api_key
         self.memory = ConversationMemory()
+        self.observation_formatter = observation_formatter or ObservationFormatter()
         
         # Create tools for API interactions
-        self.tools = create_api_tools(api_base_url, api_key)
+        self.tools = create_api_tools(api_base_url, api_key, self.observation_formatter)
         
         # Initialize LLM
         self.llm = ChatOpenAI(model=model_name, temperature=temperature)
@@ -62,6 +65,7 @@ class RESTAPIAgent:
             
 Your capabilities:
 - Manage items: create, list, retrieve, update, and delete items
+- Work on many items at once with create_items, get_items and delete_items
 - Upload files to the server
 - Check API health status
 - Access secure endpoints (when API key is provided)
@@ -69,7 +73,7 @@ Your capabilities:
 When a user asks you to do something:
 1. Understand their intent
 2. Choose the appropriate API endpoint(s)
-3. Execute the API calls
+3. Execute the API calls, using one batch tool call instead of many single-item calls when several items are involved
 4. Provide clear feedback about what was done
 
 Always be helpful, clear, and informative. If an operation fails, explain what went wrong and suggest alternatives."""),
@@ -92,8 +96,7 @@ Always be helpful, clear, and informative. If an operation fails, explain what w
             return [RESTAPIAgent._serialize_step_value(item) for item in value]
         return str(value)
 
-    @staticmethod
-    def _normalise_step(action: Any, observation: Any) -> Dict[str, Any]:
+    def _normalise_step(self, action: Any, observation: Any) -> Dict[str, Any]:
         """Normalise a LangChain intermediate step into a uniform dictionary."""
         thought: Optional[str] = None
 
@@ -127,11 +130,17 @@ Always be helpful, clear, and informative. If an operation fails, explain what w
         elif isinstance(action, dict) and action.get("input") is not None:
             tool_input = action["input"]
 
+        if isinstance(observation, str) or observation is None:
+            # Tool observations are already formatted; share the string instead of copying it.
+            rendered_observation = observation
+        else:
+            rendered_observation = self.observation_formatter.format("Result", observation)
+
         return {
             "thought": thought,
             "action": action_name,
             "input": RESTAPIAgent._serialize_step_value(tool_input),
-            "observation": RESTAPIAgent._serialize_step_value(observation),
+            "observation": rendered_observation,
         }
 
     def run(self, query: str) -> Dict[str, Any]:
@@ -0,0 +1,94 @@
+"""Compact, size-bounded rendering of tool results for the agent scratchpad."""
+from __future__ import annotations
+
+from typing import Any, Callable, List, Optional, Sequence, Union
+import json
+
+
+# A continuation hint, or a function building one from the number of entries shown.
+Hint = Union[str, Callable[[int], str]]
+
+
+class ObservationFormatter:
+    """Render tool results as compact JSON that fits within a character budget.
+
+    Every observation is resent to the LLM on each later step, so a bounded
+    observation keeps prompt size, and per-step latency, flat as results grow.
+    At roughly four characters per token the default budget is ~1000 tokens.
+    """
+
+    def __init__(
+        self,
+        max_chars: int = 4000,
+        max_items: int = 20,
+        fields: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.max_chars = max_chars
+        self.max_items = max_items
+        self.fields = list(fields) if fields else None
+
+    # Utility -----------------------------------------------------------------
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+    def _project(self, value: Any) -> Any:
+        if self.fields and isinstance(value, dict):
+            # Dicts without any of the projected fields (e.g. status payloads) pass through.
+            return {key: value[key] for key in self.fields if key in value} or value
+        return value
+
+    # Formatting --------------------------------------------------------------
+    def format(self, label: str, data: Any, hint: Optional[Hint] = None, more: bool = False) -> str:
+        """Return ``"<label>: <compact JSON>"``, truncated with a continuation hint if needed.
+
+        ``more`` marks a list as one page of a larger result, so the hint is
+        added even when every entry fits.
+        """
+        if isinstance(data, (list, tuple)):
+            return self._format_list(label, data, hint, more)
+
+        prefix = f"{label}: "
+        text = data if isinstance(data, str) else self._dumps(self._project(data))
+        if len(prefix) + len(text) <= self.max_chars:
+            return prefix + text
+        hint_text = hint(0) if callable(hint) else hint
+        suffix = f" ... (truncated at {self.max_chars} chars{'; ' + hint_text if hint_text else ''})"
+        return prefix + text[: max(0, self.max_chars - len(prefix) - len(suffix))] + suffix
+
+    def _format_list(self, label: str, values: Sequence[Any], hint: Optional[Hint], more: bool) -> str:
+        prefix = f"{label}: ["
+        texts = [self._dumps(self._project(value)) for value in values[: self.max_items]]
+
+        rendered = self._fill(texts, self.max_chars - len(prefix) - 1)
+        if len(rendered) == len(values) and not more:
+            return prefix + ",".join(rendered) + "]"
+
+        # The list is cut short, so reserve room for the suffix before filling. The
+        # suffix is longest when every entry is shown, which bounds the real one.
+        reserve = len(self._suffix(len(values), values, hint, more))
+        rendered = self._fill(texts, self.max_chars - len(prefix) - 1 - reserve)
+        text = prefix + ",".join(rendered) + "]" + self._suffix(len(rendered), values, hint, more)
+        # Only a budget smaller than the label and suffix themselves can still overflow.
+        return text if len(text) <= self.max_chars else text[: max(0, self.max_chars - 3)] + "..."
+
+    @staticmethod
+    def _fill(texts: List[str], budget: int) -> List[str]:
+        rendered: List[str] = []
+        used = 0
+        for text in texts:
+            cost = len(text) + (1 if rendered else 0)
+            if used + cost > budget:
+                if not rendered and budget > 3:
+                    # The first entry alone is too big: show a truncated part of it.
+                    rendered.append(text[: budget - 3] + "...")
+                break
+            rendered.append(text)
+            used += cost
+        return rendered
+
+    @staticmethod
+    def _suffix(shown: int, values: Sequence[Any], hint: Optional[Hint], more: bool) -> str:
+        hint_text = hint(shown) if callable(hint) else hint
+        total = f"{len(values)}+" if more else str(len(values))
+        return f" (showing {shown} of {total}{'; ' + hint_text if hint_text else ''})"
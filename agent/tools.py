@@ -1,12 +1,69 @@
-from typing import Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Tuple
+import hashlib
+import os
 import requests
 from langchain.tools import StructuredTool
 
+from .observations import ObservationFormatter
 
-def create_api_tools(api_base_url: str, api_key: Optional[str] = None) -> List[StructuredTool]:
+
+UPLOAD_CONCURRENCY = 4
+BATCH_CONCURRENCY = 8
+BULK_LIMIT = 1000
+
+
+def _format_ids(ids: List[int]) -> str:
+    """Render ids compactly, collapsing consecutive runs: [1, 2, 3, 7] -> '1-3, 7'."""
+    runs: List[str] = []
+    ordered = sorted(ids)
+    i = 0
+    while i < len(ordered):
+        j = i
+        while j + 1 < len(ordered) and ordered[j + 1] == ordered[j] + 1:
+            j += 1
+        runs.append(str(ordered[i]) if i == j else f"{ordered[i]}-{ordered[j]}")
+        i = j + 1
+    return ", ".join(runs)
+
+
+# Must match the server's blob digest chunk size (app/core/blobs.py CHUNK_SIZE).
+DIGEST_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def _file_digest(file_path: str) -> str:
+    """Chunk-tree digest used by the server: SHA-256 over the SHA-256 of each chunk."""
+    hasher = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(DIGEST_CHUNK_SIZE), b""):
+            hasher.update(hashlib.sha256(chunk).digest())
+    return hasher.hexdigest()
+
+
+def _missing_chunks(session: Dict[str, Any]) -> List[Tuple[int, int]]:
+    """Split the byte ranges not yet received by an upload session into (start, length) chunks."""
+    size, chunk_size = session["size"], session["chunk_size"]
+    chunks: List[Tuple[int, int]] = []
+    position = 0
+    for received in session["received"] + [{"start": size, "end": size - 1}]:
+        for start in range(position, received["start"], chunk_size):
+            chunks.append((start, min(chunk_size, received["start"] - start)))
+        position = max(position, received["end"] + 1)
+    return chunks
+
+
+def create_api_tools(
+    api_base_url: str,
+    api_key: Optional[str] = None,
+    formatter: Optional[ObservationFormatter] = None
+) -> List[StructuredTool]:
     """
     Create tools for interacting with the REST API.
+
+    Tool results are rendered by ``formatter`` (a default ObservationFormatter
+    if omitted) so observations stay compact and size-bounded.
     """
+    formatter = formatter or ObservationFormatter()
     headers = {}
     if api_key:
         headers["X-API-Key"] = api_key
@@ -16,7 +73,7 @@ def create_api_tools(api_base_url: str, api_key: Optional[str] = None) -> List[S
         try:
             response = requests.get(f"{api_base_url}/health")
             response.raise_for_status()
-            return f"API is healthy: {response.json()}"
+            return formatter.format("API is healthy", response.json())
         except Exception as e:
             return f"Error checking health: {str(e)}"
     
@@ -33,14 +90,14 @@ def create_api_tools(api_base_url: str, api_key: Optional[str] = None) -> List[S
             )
             response.raise_for_status()
             item = response.json()
-            return f"Created item: {item}"
+            return formatter.format("Created item", item)
         except Exception as e:
             return f"Error creating item: {str(e)}"
     
-    def list_items(query: Optional[str] = None, limit: int = 10) -> str:
-        """List items. Args: query (optional search string), limit (max items to return, default 10)."""
+    def list_items(query: Optional[str] = None, limit: int = 10, offset: int = 0) -> str:
+        """List items. Args: query (optional search string), limit (max items to return, default 10), offset (items to skip, default 0)."""
         try:
-            params = {"limit": limit}
+            params = {"limit": limit, "offset": offset}
             if query:
                 params["q"] = query
             response = requests.get(
@@ -50,7 +107,12 @@ def create_api_tools(api_base_url: str, api_key: Optional[str] = None) -> List[S
             )
             response.raise_for_status()
             items = response.json()
-            return f"Found {len(items)} items: {items}"
+            return formatter.format(
+                f"Found {len(items)} items",
+                items,
+                hint=lambda shown: f"call list_items with offset={offset + shown} for more",
+                more=len(items) == limit
+            )
         except Exception as e:
             return f"Error listing items: {str(e)}"
     
@@ -62,7 +124,7 @@ def create_api_tools(api_base_url: str, api_key: Optional[str] = None) -> List[S
                 headers=headers
             )
             response.raise_for_status()
-            return f"Item details: {response.json()}"
+            return formatter.format("Item details", response.json())
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 return f"Item with ID {item_id} not found"
@@ -83,7 +145,7 @@ def create_api_tools(api_base_url: str, api_key: Optional[str] = None) -> List[S
             )
             response.raise_for_status()
             item = response.json()
-            return f"Updated item: {item}"
+            return formatter.format("Updated item", item)
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 return f"Item with ID {item_id} not found"
@@ -101,7 +163,7 @@ def create_api_tools(api_base_url: str, api_key: Optional[str] = None) -> List[S
             if response.status_code == 204:
                 return f"Successfully deleted item {item_id}"
             response.raise_for_status()
-            return f"Deleted item: {response.json()}"
+            return formatter.format("Deleted item", response.json())
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 return f"Item with ID {item_id} not found"
@@ -109,22 +171,200 @@ def create_api_tools(api_base_url: str, api_key: Optional[str] = None) -> List[S
         except Exception as e:
             return f"Error deleting item: {str(e)}"
     
-    def upload_file(file_path: str) -> str:
-        """Upload a file. Args: file_path (path to the file to upload)."""
+    def _put_chunk(file_path: str, upload_url: str, size: int, start: int, length: int) -> None:
+        with open(file_path, 'rb') as f:
+            f.seek(start)
+            data = f.read(length)
+        chunk_headers = {
+            **headers,
+            "Content-Range": f"bytes {start}-{start + length - 1}/{size}",
+            "X-Chunk-SHA256": hashlib.sha256(data).hexdigest(),
+        }
+        response = requests.put(upload_url, data=data, headers=chunk_headers)
+        response.raise_for_status()
+
+    def _run_concurrently(func, args: List[Any]) -> List[Any]:
+        with ThreadPoolExecutor(max_workers=BATCH_CONCURRENCY) as pool:
+            return list(pool.map(func, args))
+
+    def _create_one(payload: Dict[str, Any]) -> Any:
         try:
-            with open(file_path, 'rb') as f:
-                files = {'file': f}
+            response = requests.post(f"{api_base_url}/items", json=payload, headers=headers)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            return e
+
+    def create_items(items: List[Dict[str, Any]]) -> str:
+        """Create several items at once. Args: items (list of objects with name (str), price (float), optional tags (list of strings))."""
+        payloads = []
+        for item in items:
+            payload = {"name": item.get("name"), "price": item.get("price")}
+            if item.get("tags"):
+                payload["tags"] = item["tags"]
+            payloads.append(payload)
+        if not payloads:
+            return "No items to create"
+
+        created: List[Dict[str, Any]] = []
+        errors: List[str] = []
+        try:
+            for start in range(0, len(payloads), BULK_LIMIT):
                 response = requests.post(
-                    f"{api_base_url}/files/upload",
-                    files=files,
+                    f"{api_base_url}/items/bulk",
+                    json={"items": payloads[start:start + BULK_LIMIT]},
                     headers=headers
                 )
+                if response.status_code in (404, 405) and start == 0:
+                    # Server without the bulk endpoint: fall back to concurrent single creates.
+                    for result in _run_concurrently(_create_one, payloads):
+                        if isinstance(result, Exception):
+                            errors.append(str(result))
+                        else:
+                            created.append(result)
+                    break
+                response.raise_for_status()
+                created.extend(response.json())
+        except Exception as e:
+            errors.append(str(e))
+
+        summary = f"Created {len(created)} of {len(payloads)} items"
+        if created:
+            summary += f" (ids {_format_ids([item['id'] for item in created])})"
+        if errors:
+            summary += "; " + formatter.format(f"{len(errors)} errors", errors)
+        return summary
+
+    def _get_one(item_id: int) -> Any:
+        try:
+            response = requests.get(f"{api_base_url}/items/{item_id}", headers=headers)
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            return e
+
+    def _too_many_ids(tool_name: str, item_ids: List[int]) -> Optional[str]:
+        if len(item_ids) > BULK_LIMIT:
+            return (
+                f"Error: {len(item_ids)} ids is too many for one call; "
+                f"call {tool_name} again with at most {BULK_LIMIT} ids at a time"
+            )
+        return None
+
+    def get_items(item_ids: List[int]) -> str:
+        """Get several items by ID at once (at most 1000 ids). Args: item_ids (list of integers)."""
+        error = _too_many_ids("get_items", item_ids)
+        if error or not item_ids:
+            return error or "No items to get"
+
+        found: List[Dict[str, Any]] = []
+        errors: List[str] = []
+        try:
+            response = requests.post(f"{api_base_url}/items/bulk-get", json={"ids": item_ids}, headers=headers)
+            if response.status_code in (404, 405):
+                # Server without the bulk endpoint: fall back to concurrent single gets.
+                results = _run_concurrently(_get_one, item_ids)
+                found = [r for r in results if isinstance(r, dict)]
+                errors = [str(r) for r in results if isinstance(r, Exception)]
+            else:
+                response.raise_for_status()
+                found = response.json()
+        except Exception as e:
+            return f"Error getting items: {str(e)}"
+
+        found_ids = {item["id"] for item in found}
+        missing = [i for i in item_ids if i not in found_ids]
+        summary = formatter.format(
+            f"Found {len(found)} of {len(item_ids)} items", found, hint="request fewer ids to see the rest"
+        )
+        if missing and not errors:
+            summary += f"; not found: {_format_ids(missing)}"
+        if errors:
+            summary += "; " + formatter.format(f"{len(errors)} errors", errors)
+        return summary
+
+    def _delete_one(item_id: int) -> Any:
+        try:
+            response = requests.delete(f"{api_base_url}/items/{item_id}", headers=headers)
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            return True
+        except Exception as e:
+            return e
+
+    def delete_items(item_ids: List[int]) -> str:
+        """Delete several items by ID at once (at most 1000 ids). Args: item_ids (list of integers)."""
+        error = _too_many_ids("delete_items", item_ids)
+        if error or not item_ids:
+            return error or "No items to delete"
+
+        errors: List[str] = []
+        try:
+            response = requests.post(f"{api_base_url}/items/bulk-delete", json={"ids": item_ids}, headers=headers)
+            if response.status_code in (404, 405):
+                # Server without the bulk endpoint: fall back to concurrent single deletes.
+                results = _run_concurrently(_delete_one, item_ids)
+                deleted = [i for i, r in zip(item_ids, results) if r is True]
+                missing = [i for i, r in zip(item_ids, results) if r is None]
+                errors = [str(r) for r in results if isinstance(r, Exception)]
+            else:
                 response.raise_for_status()
                 result = response.json()
-                return f"File uploaded successfully: {result}"
+                deleted, missing = result["deleted"], result["not_found"]
+        except Exception as e:
+            return f"Error deleting items: {str(e)}"
+
+        summary = f"Deleted {len(deleted)} of {len(item_ids)} items"
+        if deleted:
+            summary += f" (ids {_format_ids(deleted)})"
+        if missing:
+            summary += f"; not found: {_format_ids(missing)}"
+        if errors:
+            summary += "; " + formatter.format(f"{len(errors)} errors", errors)
+        return summary
+    
+    def upload_file(file_path: str, upload_id: Optional[str] = None) -> str:
+        """Upload a file in concurrent chunks. Args: file_path (path to the file to upload), upload_id (optional, resumes a failed upload)."""
+        try:
+            size = os.path.getsize(file_path)
+            if upload_id:
+                response = requests.get(
+                    f"{api_base_url}/files/uploads/{upload_id}",
+                    headers=headers
+                )
+            else:
+                response = requests.post(
+                    f"{api_base_url}/files/uploads",
+                    # Sending the digest lets the server skip the transfer if it already has the file.
+                    json={"filename": os.path.basename(file_path), "size": size, "digest": _file_digest(file_path)},
+                    headers=headers
+                )
+            response.raise_for_status()
+            session = response.json()
+            upload_id = session["upload_id"]
+            if session["size"] != size:
+                return f"Error: upload {upload_id} expects {session['size']} bytes but {file_path} has {size}"
+
+            upload_url = f"{api_base_url}/files/uploads/{upload_id}"
+            with ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY) as pool:
+                futures = [
+                    pool.submit(_put_chunk, file_path, upload_url, size, start, length)
+                    for start, length in _missing_chunks(session)
+                ]
+                for future in futures:
+                    future.result()
+
+            response = requests.post(f"{upload_url}/complete", headers=headers)
+            response.raise_for_status()
+            return formatter.format("File uploaded successfully", response.json())
         except FileNotFoundError:
             return f"Error: File not found at {file_path}"
         except Exception as e:
+            if upload_id:
+                return f"Error uploading file (resume with upload_id={upload_id}): {str(e)}"
             return f"Error uploading file: {str(e)}"
     
     def get_secret() -> str:
@@ -137,7 +377,7 @@ def create_api_tools(api_base_url: str, api_key: Optional[str] = None) -> List[S
                 headers=headers
             )
             response.raise_for_status()
-            return f"Secret: {response.json()}"
+            return formatter.format("Secret", response.json())
         except Exception as e:
             return f"Error accessing secret: {str(e)}"
     
@@ -173,10 +413,25 @@ def create_api_tools(api_base_url: str, api_key: Optional[str] = None) -> List[S
             func=delete_item,
             description="Delete an item by its ID"
         ),
+        StructuredTool.from_function(
+            name="create_items",
+            func=create_items,
+            description="Create many items in one call; use instead of repeated create_item calls"
+        ),
+        StructuredTool.from_function(
+            name="get_items",
+            func=get_items,
+            description="Get details of up to 1000 items by their IDs in one call"
+        ),
+        StructuredTool.from_function(
+            name="delete_items",
+            func=delete_items,
+            description="Delete up to 1000 items by their IDs in one call; use instead of repeated delete_item calls"
+        ),
         StructuredTool.from_function(
             name="upload_file",
             func=upload_file,
-            description="Upload a file to the server"
+            description="Upload a file to the server in resumable chunks; pass upload_id to resume a failed upload"
         ),
         StructuredTool.from_function(
             name="get_secret",
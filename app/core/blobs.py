@@ -0,0 +1,151 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from typing import BinaryIO, Dict, Iterable, Optional, Set, Tuple
+
+from .config import settings
+
+
+# Blobs are addressed by a chunk-tree digest: the SHA-256 of the concatenated
+# SHA-256 digests of consecutive CHUNK_SIZE chunks. Resumable uploads hash each
+# chunk as it arrives, so the file digest is known without reading the file back.
+# Changing CHUNK_SIZE changes every digest; clients computing digests must match it.
+CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def tree_digest(chunk_digests: Iterable[bytes]) -> str:
+    """Combine raw per-chunk SHA-256 digests, in file order, into the blob digest."""
+    hasher = hashlib.sha256()
+    for chunk_digest in chunk_digests:
+        hasher.update(chunk_digest)
+    return hasher.hexdigest()
+
+
+def hash_stream(stream: BinaryIO) -> Tuple[str, int]:
+    """Return the tree digest and size of a binary stream, read chunk by chunk."""
+    chunk_digests = []
+    size = 0
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        if not chunk:
+            break
+        chunk_digests.append(hashlib.sha256(chunk).digest())
+        size += len(chunk)
+    return tree_digest(chunk_digests), size
+
+
+class BlobStore:
+    """Content-addressed file store keeping each blob once under its digest.
+
+    Reference counts track how many uploads point at a blob and are persisted
+    in a ``<digest>.refs`` file next to it; the blob file is removed when the
+    last reference is released. A blob found without a readable count is
+    pinned: it keeps at least one reference and is never deleted.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.refcounts: Dict[str, int] = {}
+        self._pinned: Set[str] = set()
+        self._lock = threading.Lock()
+        if os.path.isdir(root):
+            self._load()
+
+    def _load(self) -> None:
+        for dirpath, _, names in os.walk(self.root):
+            for name in names:
+                path = os.path.join(dirpath, name)
+                if name.endswith(".tmp"):
+                    # Left by a copy or count update interrupted by a crash.
+                    os.remove(path)
+                elif len(name) == 64:
+                    try:
+                        with open(path + ".refs") as f:
+                            self.refcounts[name] = int(f.read())
+                    except (OSError, ValueError):
+                        self.refcounts[name] = 1
+                        self._pinned.add(name)
+
+    def path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def _save_count(self, digest: str) -> None:
+        # Callers hold _lock. Write then rename so a crash never leaves a partial count.
+        refs_path = self.path(digest) + ".refs"
+        with open(refs_path + ".tmp", "w") as f:
+            f.write(str(self.refcounts[digest]))
+        os.replace(refs_path + ".tmp", refs_path)
+
+    def exists(self, digest: str, size: Optional[int] = None) -> bool:
+        if digest not in self.refcounts:
+            return False
+        return size is None or os.path.getsize(self.path(digest)) == size
+
+    def acquire(self, digest: str, size: int) -> bool:
+        """Add a reference to an existing blob of the given size; False if there is none."""
+        with self._lock:
+            if not self.exists(digest, size):
+                return False
+            self.refcounts[digest] += 1
+            self._save_count(digest)
+            return True
+
+    def add_file(self, src_path: str, digest: str) -> bool:
+        """Move ``src_path`` into the store as ``digest``; returns False if it was a duplicate.
+
+        ``src_path`` must be on the same filesystem as the store so the move is a rename.
+        """
+        with self._lock:
+            if digest in self.refcounts:
+                self.refcounts[digest] += 1
+                self._save_count(digest)
+                os.remove(src_path)
+                return False
+            blob_path = self.path(digest)
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            os.replace(src_path, blob_path)
+            self.refcounts[digest] = 1
+            self._save_count(digest)
+            return True
+
+    def add_stream(self, stream: BinaryIO, digest: str) -> bool:
+        """Store the contents of ``stream`` as ``digest`` unless the blob already exists.
+
+        A duplicate only gains a reference; nothing is written for its data.
+        """
+        with self._lock:
+            if digest in self.refcounts:
+                self.refcounts[digest] += 1
+                self._save_count(digest)
+                return False
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                shutil.copyfileobj(stream, tmp, CHUNK_SIZE)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        return self.add_file(tmp_path, digest)
+
+    def release(self, digest: str) -> bool:
+        """Drop one reference, deleting the blob with its last one; False if unknown."""
+        with self._lock:
+            count = self.refcounts.get(digest)
+            if count is None:
+                return False
+            if count > 1:
+                self.refcounts[digest] = count - 1
+                self._save_count(digest)
+                return True
+            if digest in self._pinned:
+                return True
+            del self.refcounts[digest]
+            os.remove(self.path(digest))
+            os.remove(self.path(digest) + ".refs")
+            return True
+
+
+BLOBS = BlobStore(os.path.join(settings.upload_dir, "blobs"))
@@ -6,7 +6,9 @@ class Settings(BaseModel):
     version: str = "1.0.0"
     api_key_header_name: str = "X-API-Key"
     API_KEY: str = "secret123"
+    upload_dir: str = "uploads"
+    upload_max_size: int = 64 * 1024 * 1024 * 1024
+    upload_session_ttl: int = 24 * 60 * 60
 
 
 settings = Settings()
-
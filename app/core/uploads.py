@@ -0,0 +1,123 @@
+import os
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Set, Tuple
+
+from .blobs import CHUNK_SIZE, tree_digest
+from .config import settings
+
+
+PARTS_DIR = os.path.join(settings.upload_dir, ".parts")
+
+
+class UploadSession:
+    """A resumable upload being assembled in place in a preallocated part file.
+
+    Chunks are aligned to ``CHUNK_SIZE`` and written at their byte offset as
+    they arrive; the SHA-256 of each chunk is kept, so the file digest is
+    combined from them without reading the data back. A session created with
+    ``stored=True`` refers to a blob that already holds the declared ``digest``
+    and needs no data.
+    """
+
+    def __init__(self, filename: str, size: int, digest: Optional[str] = None, stored: bool = False) -> None:
+        self.upload_id = uuid.uuid4().hex
+        self.filename = os.path.basename(filename) or "upload"
+        self.size = size
+        self.digest = digest
+        self.stored = stored
+        # Raw SHA-256 of each received chunk, keyed by chunk index.
+        self.chunk_digests: Dict[int, bytes] = {}
+        # Chunks currently being written, so a duplicate PUT cannot overwrite them.
+        self._pending: Set[int] = set()
+        self.part_path = os.path.join(PARTS_DIR, f"{self.upload_id}.part")
+        # Received byte ranges as sorted, non-overlapping half-open [start, end) pairs.
+        self.received: List[Tuple[int, int]] = []
+        self._lock = threading.Lock()
+        self.last_active = time.monotonic()
+
+        if stored:
+            self.received = [(0, size)] if size else []
+            return
+        os.makedirs(os.path.dirname(self.part_path), exist_ok=True)
+        try:
+            with open(self.part_path, "wb") as f:
+                f.truncate(size)
+        except OSError:
+            self.discard()
+            raise
+
+    def touch(self) -> None:
+        self.last_active = time.monotonic()
+
+    @property
+    def chunk_count(self) -> int:
+        return -(-self.size // CHUNK_SIZE)
+
+    def claim_chunk(self, index: int) -> bool:
+        """Reserve a chunk for writing; False if it is already received or in progress."""
+        with self._lock:
+            if index in self.chunk_digests or index in self._pending:
+                return False
+            self._pending.add(index)
+            return True
+
+    def release_chunk(self, index: int) -> None:
+        with self._lock:
+            self._pending.discard(index)
+
+    def mark_received(self, start: int, end: int, chunk_digest: bytes) -> None:
+        with self._lock:
+            self._pending.discard(start // CHUNK_SIZE)
+            self.chunk_digests[start // CHUNK_SIZE] = chunk_digest
+            merged: List[Tuple[int, int]] = []
+            for s, e in sorted(self.received + [(start, end)]):
+                if merged and s <= merged[-1][1]:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], e))
+                else:
+                    merged.append((s, e))
+            self.received = merged
+            self.last_active = time.monotonic()
+
+    @property
+    def complete(self) -> bool:
+        if self.size == 0:
+            return True
+        return self.received == [(0, self.size)]
+
+    def file_digest(self) -> str:
+        """Digest of the assembled file, combined from the per-chunk digests."""
+        return tree_digest(self.chunk_digests[index] for index in range(self.chunk_count))
+
+    def discard(self) -> None:
+        try:
+            os.remove(self.part_path)
+        except FileNotFoundError:
+            pass
+
+
+SESSIONS: Dict[str, UploadSession] = {}
+
+
+def sweep_parts() -> None:
+    """Delete part files left by a previous run; their sessions lived only in memory."""
+    if not os.path.isdir(PARTS_DIR):
+        return
+    for name in os.listdir(PARTS_DIR):
+        try:
+            os.remove(os.path.join(PARTS_DIR, name))
+        except OSError:
+            pass
+
+
+def expire_sessions() -> None:
+    """Drop sessions idle for longer than ``settings.upload_session_ttl`` and delete their part files."""
+    cutoff = time.monotonic() - settings.upload_session_ttl
+    for upload_id, session in list(SESSIONS.items()):
+        if session.last_active < cutoff:
+            SESSIONS.pop(upload_id, None)
+            session.discard()
+
+
+sweep_parts()
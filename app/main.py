@@ -10,7 +10,7 @@ from app.routers import secure
 tags_metadata = [
     {"name": "health", "description": "Service health and diagnostics."},
     {"name": "items", "description": "CRUD operations for items."},
-    {"name": "files", "description": "File upload endpoints."},
+    {"name": "files", "description": "Content-addressed file storage with resumable chunked uploads."},
     {"name": "secure", "description": "API key protected endpoints."},
 ]
 
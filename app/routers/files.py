@@ -1,11 +1,225 @@
-from fastapi import APIRouter, File, UploadFile
+import hashlib
+import os
+import re
+from typing import Optional
+
+from fastapi import APIRouter, File, Header, HTTPException, Path, Request, Response, UploadFile, status
+from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.core.blobs import BLOBS, CHUNK_SIZE, hash_stream
+from app.core.uploads import SESSIONS, UploadSession, expire_sessions
+from app.schemas.upload import ByteRange, StoredFile, UploadSessionCreate, UploadSessionStatus
 
 
 router = APIRouter(prefix="/files", tags=["files"])
 
 
-@router.post("/upload", summary="Upload a file", responses={200: {"description": "Upload ok"}})
+CONTENT_RANGE_RE = re.compile(r"^bytes (\d+)-(\d+)/(\d+)$")
+DIGEST_PATTERN = "^[0-9a-f]{64}$"
+
+
+@router.post("/upload", response_model=StoredFile, summary="Upload a file", responses={200: {"description": "Upload ok"}})
 async def upload(file: UploadFile = File(..., description="Any file")):
-    content = await file.read()
-    return {"filename": file.filename, "size": len(content)}
+    # The multipart body is already spooled; hash it first so a duplicate is never copied.
+    digest, size = await run_in_threadpool(hash_stream, file.file)
+    await file.seek(0)
+    created = await run_in_threadpool(BLOBS.add_stream, file.file, digest)
+    return StoredFile(filename=file.filename, size=size, digest=digest, deduplicated=not created)
+
+
+def _get_session(upload_id: str) -> UploadSession:
+    expire_sessions()
+    session = SESSIONS.get(upload_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    return session
+
+
+def _status(session: UploadSession) -> UploadSessionStatus:
+    return UploadSessionStatus(
+        upload_id=session.upload_id,
+        filename=session.filename,
+        size=session.size,
+        chunk_size=CHUNK_SIZE,
+        received=[ByteRange(start=s, end=e - 1) for s, e in session.received],
+        complete=session.complete,
+    )
+
+
+@router.post(
+    "/uploads",
+    response_model=UploadSessionStatus,
+    status_code=status.HTTP_201_CREATED,
+    summary="Start a resumable upload",
+    description="Sessions idle for longer than the configured TTL are discarded.",
+    responses={
+        201: {"description": "Upload session created"},
+        413: {"description": "File too large to preallocate"},
+    },
+)
+def create_upload_session(payload: UploadSessionCreate):
+    expire_sessions()
+    # Only probe here; the blob reference is taken when the upload completes.
+    stored = payload.digest is not None and BLOBS.exists(payload.digest, payload.size)
+    try:
+        session = UploadSession(payload.filename, payload.size, digest=payload.digest, stored=stored)
+    except OSError:
+        raise HTTPException(status_code=413, detail="File too large")
+    SESSIONS[session.upload_id] = session
+    return _status(session)
+
+
+@router.get(
+    "/uploads/{upload_id}",
+    response_model=UploadSessionStatus,
+    summary="Get received byte ranges of an upload",
+    responses={404: {"description": "Upload session not found"}},
+)
+def get_upload_session(upload_id: str = Path(..., description="Upload session ID")):
+    return _status(_get_session(upload_id))
+
+
+@router.put(
+    "/uploads/{upload_id}",
+    response_model=UploadSessionStatus,
+    summary="Upload a byte-range chunk",
+    description="Send raw bytes with a `Content-Range: bytes start-end/size` header covering exactly "
+    "one `chunk_size`-aligned chunk. Chunks may be sent in any order and in parallel.",
+    responses={
+        400: {"description": "Chunk length or checksum mismatch"},
+        404: {"description": "Upload session not found"},
+        409: {"description": "Upload complete, or chunk already received"},
+        416: {"description": "Invalid Content-Range"},
+    },
+)
+async def upload_chunk(
+    request: Request,
+    upload_id: str = Path(..., description="Upload session ID"),
+    content_range: str = Header(..., description="bytes start-end/size, e.g. bytes 0-8388607/1073741824"),
+    x_chunk_sha256: Optional[str] = Header(default=None, description="Hex SHA-256 of the chunk body"),
+):
+    session = _get_session(upload_id)
+    if session.stored or session.complete:
+        raise HTTPException(status_code=409, detail="Upload already complete")
+    session.touch()
+    match = CONTENT_RANGE_RE.match(content_range.strip())
+    if not match:
+        raise HTTPException(status_code=416, detail="Malformed Content-Range")
+    start, last, total = (int(g) for g in match.groups())
+    if total != session.size or start > last or last >= session.size:
+        raise HTTPException(status_code=416, detail="Content-Range outside upload size")
+    if start % CHUNK_SIZE or last + 1 != min(start + CHUNK_SIZE, session.size):
+        raise HTTPException(status_code=416, detail="Content-Range must cover exactly one aligned chunk")
+
+    index = start // CHUNK_SIZE
+    if not session.claim_chunk(index):
+        raise HTTPException(status_code=409, detail="Chunk already received or in progress")
+
+    try:
+        expected = last - start + 1
+        hasher = hashlib.sha256()
+        written = 0
+        try:
+            fd = os.open(session.part_path, os.O_WRONLY)
+        except FileNotFoundError:
+            # The session was aborted or expired after it was looked up.
+            raise HTTPException(status_code=404, detail="Upload session not found")
+        try:
+            async for piece in request.stream():
+                if not piece:
+                    continue
+                if written + len(piece) > expected:
+                    raise HTTPException(status_code=400, detail="Chunk longer than Content-Range")
+                hasher.update(piece)
+                await run_in_threadpool(os.pwrite, fd, piece, start + written)
+                written += len(piece)
+        finally:
+            os.close(fd)
+
+        if written != expected:
+            raise HTTPException(status_code=400, detail="Chunk shorter than Content-Range")
+        if x_chunk_sha256 is not None and hasher.hexdigest() != x_chunk_sha256.lower():
+            raise HTTPException(status_code=400, detail="Chunk checksum mismatch")
+        session.mark_received(start, last + 1, hasher.digest())
+    except BaseException:
+        session.release_chunk(index)
+        raise
+
+    return _status(session)
+
+
+@router.post(
+    "/uploads/{upload_id}/complete",
+    response_model=StoredFile,
+    summary="Finalize a resumable upload",
+    responses={
+        200: {"description": "Upload ok"},
+        400: {"description": "File does not match the declared digest"},
+        404: {"description": "Upload session not found"},
+        409: {"description": "Upload has missing byte ranges, or the stored file it refers to is gone"},
+    },
+)
+async def complete_upload(upload_id: str = Path(..., description="Upload session ID")):
+    session = _get_session(upload_id)
+    if not session.complete:
+        raise HTTPException(status_code=409, detail="Upload incomplete")
+    SESSIONS.pop(upload_id, None)
+    if session.stored:
+        if not BLOBS.acquire(session.digest, session.size):
+            raise HTTPException(status_code=409, detail="Stored file no longer exists; start a new upload")
+        return StoredFile(filename=session.filename, size=session.size, digest=session.digest, deduplicated=True)
+
+    digest = session.file_digest()
+    if session.digest is not None and digest != session.digest:
+        session.discard()
+        raise HTTPException(status_code=400, detail="File does not match the declared digest")
+    try:
+        created = await run_in_threadpool(BLOBS.add_file, session.part_path, digest)
+    except BaseException:
+        # The session is already gone, so nothing else could clean up its part file.
+        session.discard()
+        raise
+    return StoredFile(filename=session.filename, size=session.size, digest=digest, deduplicated=not created)
+
+
+@router.delete("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Abort a resumable upload")
+def abort_upload(upload_id: str = Path(..., description="Upload session ID")):
+    session = _get_session(upload_id)
+    SESSIONS.pop(upload_id, None)
+    session.discard()
+    return
+
+
+@router.get(
+    "/{digest}",
+    response_class=FileResponse,
+    summary="Download a stored file",
+    description="Supports Range requests; the ETag is the content digest. The file is sent zero-copy only "
+    "when the ASGI server offers the `pathsend` extension; under uvicorn it is streamed in 64 KiB chunks.",
+    responses={
+        200: {"description": "File content", "content": {"application/octet-stream": {}}},
+        206: {"description": "Partial content"},
+        304: {"description": "Not modified"},
+        404: {"description": "File not found"},
+    },
+)
+def download(
+    digest: str = Path(..., pattern=DIGEST_PATTERN, description="Chunk-tree digest of the file"),
+    if_none_match: Optional[str] = Header(default=None),
+):
+    if not BLOBS.exists(digest):
+        raise HTTPException(status_code=404, detail="Not found")
+    etag = f'"{digest}"'
+    # Blobs are immutable, so a matching ETag always means the client copy is current.
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=31536000, immutable"}
+    if if_none_match is not None and (if_none_match.strip() == "*" or etag in if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return FileResponse(BLOBS.path(digest), media_type="application/octet-stream", headers=headers)
+
 
+@router.delete("/{digest}", status_code=status.HTTP_204_NO_CONTENT, summary="Release a stored file")
+def release(digest: str = Path(..., pattern=DIGEST_PATTERN, description="Chunk-tree digest of the file")):
+    if not BLOBS.release(digest):
+        raise HTTPException(status_code=404, detail="Not found")
+    return
@@ -1,14 +1,28 @@
-from typing import Dict, List, Optional
+import threading
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
 
 from fastapi import APIRouter, Body, HTTPException, Path, Query, status
+from fastapi.responses import JSONResponse
 
-from app.schemas.item import Item, ItemCreate
+from app.schemas.item import Item, ItemBulkCreate, ItemBulkDeleteResult, ItemCreate, ItemIds, ItemRecord
 
 
 router = APIRouter(prefix="/items", tags=["items"])
 
 
-DB: Dict[int, Item] = {}
+# Items are stored as compact records; ``response_model`` stays for the OpenAPI
+# schema, but handlers return ``JSONResponse`` so stored data is not validated again.
+DB: Dict[int, ItemRecord] = {}
+# Sync handlers run concurrently in the threadpool; writes to DB, and reads that
+# iterate it, hold this lock so id assignment and insertion happen atomically.
+DB_LOCK = threading.Lock()
+
+
+def _next_id() -> int:
+    # Ids are only ever inserted in increasing order, so the last key is the max.
+    # Callers must hold DB_LOCK.
+    return next(reversed(DB)) + 1 if DB else 1
 
 
 @router.post(
@@ -30,10 +44,59 @@ def create_item(
         },
     )
 ):
-    new_id = (max(DB.keys()) + 1) if DB else 1
-    item = Item(id=new_id, **payload.model_dump())
-    DB[new_id] = item
-    return item
+    with DB_LOCK:
+        record = ItemRecord.from_create(_next_id(), payload)
+        DB[record.id] = record
+    return JSONResponse(status_code=status.HTTP_201_CREATED, content=record.to_dict())
+
+
+@router.post(
+    "/bulk",
+    response_model=List[Item],
+    status_code=status.HTTP_201_CREATED,
+    summary="Create items in bulk",
+    responses={201: {"description": "Items created"}, 422: {"description": "Validation error"}},
+)
+def create_items(
+    payload: ItemBulkCreate = Body(
+        ...,
+        examples={
+            "basic": {
+                "summary": "Two items",
+                "value": {"items": [{"name": "Widget", "price": 9.99}, {"name": "Gadget", "price": 19.5}]},
+            },
+        },
+    )
+):
+    with DB_LOCK:
+        first_id = _next_id()
+        records = [ItemRecord.from_create(first_id + i, item) for i, item in enumerate(payload.items)]
+        for record in records:
+            DB[record.id] = record
+    return JSONResponse(status_code=status.HTTP_201_CREATED, content=[r.to_dict() for r in records])
+
+
+@router.post(
+    "/bulk-get",
+    response_model=List[Item],
+    summary="Get items by ids",
+    description="Returns the items that exist, in the order requested; unknown ids are skipped.",
+)
+def get_items(payload: ItemIds = Body(...)):
+    records = [DB.get(item_id) for item_id in payload.ids]
+    return JSONResponse(content=[r.to_dict() for r in records if r is not None])
+
+
+@router.post("/bulk-delete", response_model=ItemBulkDeleteResult, summary="Delete items by ids")
+def delete_items(payload: ItemIds = Body(...)):
+    result = ItemBulkDeleteResult()
+    with DB_LOCK:
+        for item_id in payload.ids:
+            if DB.pop(item_id, None) is None:
+                result.not_found.append(item_id)
+            else:
+                result.deleted.append(item_id)
+    return result
 
 
 @router.get("", response_model=List[Item], summary="List items")
@@ -42,32 +105,38 @@ def list_items(
     limit: int = Query(default=10, ge=1, le=100),
     offset: int = Query(default=0, ge=0),
 ):
-    items: List[Item] = list(DB.values())
-    if q:
-        items = [i for i in items if q.lower() in i.name.lower()]
-    return items[offset : offset + limit]
+    with DB_LOCK:
+        records: Iterable[ItemRecord] = DB.values()
+        if q:
+            needle = q.lower()
+            records = (r for r in records if needle in r.name.lower())
+        page = list(islice(records, offset, offset + limit))
+    return JSONResponse(content=[r.to_dict() for r in page])
 
 
 @router.get("/{item_id}", response_model=Item, summary="Get item by id", responses={404: {"description": "Item not found"}})
 def get_item(item_id: int = Path(..., ge=1, description="Item ID")):
-    if item_id not in DB:
+    record = DB.get(item_id)
+    if record is None:
         raise HTTPException(status_code=404, detail="Not found")
-    return DB[item_id]
+    return JSONResponse(content=record.to_dict())
 
 
 @router.put("/{item_id}", response_model=Item, summary="Replace item")
 def replace_item(item_id: int = Path(..., ge=1), payload: ItemCreate = Body(...)):
-    if item_id not in DB:
-        raise HTTPException(status_code=404, detail="Not found")
-    item = Item(id=item_id, **payload.model_dump())
-    DB[item_id] = item
-    return item
+    record = ItemRecord.from_create(item_id, payload)
+    with DB_LOCK:
+        if item_id not in DB:
+            raise HTTPException(status_code=404, detail="Not found")
+        DB[item_id] = record
+    return JSONResponse(content=record.to_dict())
 
 
 @router.delete("/{item_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete item")
 def delete_item(item_id: int = Path(..., ge=1)):
-    if item_id not in DB:
-        raise HTTPException(status_code=404, detail="Not found")
-    del DB[item_id]
+    with DB_LOCK:
+        if item_id not in DB:
+            raise HTTPException(status_code=404, detail="Not found")
+        del DB[item_id]
     return
 
@@ -1,4 +1,5 @@
-from typing import List, Optional
+import sys
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -15,3 +16,42 @@ class ItemCreate(BaseModel):
     price: float = Field(..., ge=0, example=12.99)
     tags: Optional[List[str]] = Field(default=None, example=["new"])
 
+
+class ItemBulkCreate(BaseModel):
+    items: List[ItemCreate] = Field(..., min_length=1, max_length=1000)
+
+
+class ItemIds(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=1000, example=[1, 2, 3])
+
+
+class ItemBulkDeleteResult(BaseModel):
+    deleted: List[int] = Field(default_factory=list, example=[1, 2])
+    not_found: List[int] = Field(default_factory=list, example=[3])
+
+
+def intern_tags(tags: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Return tags as a tuple of interned strings so repeated tags share memory."""
+    if not tags:
+        return ()
+    return tuple(sys.intern(tag) for tag in tags)
+
+
+class ItemRecord(NamedTuple):
+    """Compact, already-validated storage form of an item.
+
+    Records are only built from data that has passed ``ItemCreate`` validation,
+    so they are converted to the response shape without validating again.
+    """
+
+    id: int
+    name: str
+    price: float
+    tags: Tuple[str, ...]
+
+    @classmethod
+    def from_create(cls, item_id: int, payload: ItemCreate) -> "ItemRecord":
+        return cls(item_id, payload.name, payload.price, intern_tags(payload.tags))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "name": self.name, "price": self.price, "tags": list(self.tags)}
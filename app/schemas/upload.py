@@ -0,0 +1,43 @@
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+
+
+class UploadSessionCreate(BaseModel):
+    filename: str = Field(..., min_length=1, max_length=255, example="dataset.bin")
+    size: int = Field(
+        ..., ge=0, le=settings.upload_max_size, example=1073741824, description="Total file size in bytes"
+    )
+    digest: Optional[str] = Field(
+        default=None,
+        pattern="^[0-9a-f]{64}$",
+        description="Chunk-tree digest of the whole file (SHA-256 of the concatenated SHA-256 "
+        "of each chunk); if already stored, no data needs to be sent",
+    )
+
+
+class ByteRange(BaseModel):
+    start: int = Field(..., ge=0, example=0, description="First byte offset (inclusive)")
+    end: int = Field(..., ge=0, example=8388607, description="Last byte offset (inclusive)")
+
+
+class UploadSessionStatus(BaseModel):
+    upload_id: str = Field(..., example="3f2c9a0e5b7d4c1f8e6a2b9d0c4f7e1a")
+    filename: str = Field(..., example="dataset.bin")
+    size: int = Field(..., example=1073741824)
+    chunk_size: int = Field(
+        ..., example=8388608, description="Chunk size in bytes; each chunk must cover exactly one aligned chunk"
+    )
+    received: List[ByteRange] = Field(default_factory=list, description="Byte ranges stored so far")
+    complete: bool = Field(..., example=False)
+
+
+class StoredFile(BaseModel):
+    filename: str = Field(..., example="dataset.bin")
+    size: int = Field(..., example=1073741824)
+    digest: str = Field(
+        ..., example="9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08", description="Chunk-tree digest"
+    )
+    deduplicated: bool = Field(..., example=False, description="True if the content was already stored")
@@ -0,0 +1,91 @@
+"""
+Micro-benchmark for item storage: validated ``Item`` models vs ``ItemRecord`` tuples.
+
+Measures per-item CPU time for create and list, and, in a separate traced run,
+per-item memory of the stored representation.
+
+Run: python -m benchmarks.items_bench [N]   (default N = 1_000_000)
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from app.schemas.item import Item, ItemCreate, ItemRecord
+
+
+TAG_SETS = (["new", "hot"], ["sale"], ["new", "sale", "tech"], None)
+
+
+def _payloads(n: int) -> List[ItemCreate]:
+    # Tag strings are fresh objects per item, as they would be when parsed from request JSON.
+    payloads = []
+    for i in range(n):
+        tags = TAG_SETS[i % len(TAG_SETS)]
+        fresh = [t.encode().decode() for t in tags] if tags else None
+        payloads.append(ItemCreate(name=f"item-{i}", price=float(i % 1000), tags=fresh))
+    return payloads
+
+
+def create_models(payloads: List[ItemCreate]) -> Dict[int, Item]:
+    db: Dict[int, Item] = {}
+    for i, payload in enumerate(payloads, start=1):
+        db[i] = Item(id=i, **payload.model_dump(exclude_none=True))
+    return db
+
+
+def create_records(payloads: List[ItemCreate]) -> Dict[int, ItemRecord]:
+    db: Dict[int, ItemRecord] = {}
+    for i, payload in enumerate(payloads, start=1):
+        db[i] = ItemRecord.from_create(i, payload)
+    return db
+
+
+def list_models(db: Dict[int, Item]) -> list:
+    # What ``response_model=List[Item]`` did: validate each item, then dump it.
+    return [Item.model_validate(item.model_dump()).model_dump() for item in db.values()]
+
+
+def list_records(db: Dict[int, ItemRecord]) -> list:
+    return [record.to_dict() for record in db.values()]
+
+
+def _timed(fn: Callable, *args):
+    # CPU time of this process only, so it is not skewed by other load on the machine.
+    start = time.process_time()
+    result = fn(*args)
+    return result, time.process_time() - start
+
+
+def _create_memory(fn: Callable, payloads: List[ItemCreate]) -> int:
+    # A separate, untimed run: tracemalloc slows allocation and would distort the CPU timings.
+    gc.collect()
+    tracemalloc.start()
+    db = fn(payloads)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del db
+    return size
+
+
+def main(n: int) -> None:
+    payloads = _payloads(n)
+    print(f"items: {n:,}")
+    print(f"{'variant':<10}{'create us/item':>16}{'list us/item':>14}{'bytes/item':>12}")
+
+    for label, create, listing in (
+        ("model", create_models, list_models),
+        ("record", create_records, list_records),
+    ):
+        gc.collect()
+        db, create_s = _timed(create, payloads)
+        _, list_s = _timed(listing, db)
+        del db
+        size = _create_memory(create, payloads)
+        print(f"{label:<10}{create_s / n * 1e6:>16.2f}{list_s / n * 1e6:>14.2f}{size / n:>12.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)